@@ -1,5 +1,9 @@
 from .calibration import *
 from .frame import *
 from .preview import *
+from .archive import *
+from .rig import *
+from .stream import *
+from .governor import *
 from .logger import *
 __version__ = '0.1.0'
\ No newline at end of file
@@ -0,0 +1,248 @@
+import zlib
+import bisect
+import queue
+import struct
+import threading
+import numpy as np
+from .logger import Logger
+
+log = Logger("Archive", "log/Archive")
+
+# 파일 구조
+# [헤더] [청크 헤더 0][청크 0] [청크 헤더 1][청크 1] ... [인덱스] [푸터]
+# 각 청크는 chunk_size 개의 프레임을 zlib 으로 압축한 블록이며, 청크의 첫 프레임은 항상 키 프레임입니다.
+# 기록이 비정상 종료되어 푸터가 없으면, 청크 헤더를 순서대로 읽어 인덱스를 복구합니다.
+MAGIC = b"SX2D"
+CHUNK_MAGIC = b"SX2C"
+VERSION = 2
+FLAG_DELTA = 0x01
+
+HEADER = struct.Struct("<4sHHIII")   # magic, version, flags, width, height, chunk_size
+CHUNK = struct.Struct("<4sIIQ")      # magic, first_frame, frame_count, length
+INDEX = struct.Struct("<QQII")       # offset, length, first_frame, frame_count
+FOOTER = struct.Struct("<QI4s")      # index_offset, chunk_count, magic
+
+
+class DepthWriter:
+    def __init__(self, path: str, frame_size: tuple, chunk_size: int = 32, delta: bool = True, level: int = 1, queue_size: int = 64):
+        """
+        DepthWriter 객체를 초기화합니다.
+
+        :param path: 아카이브 파일 경로
+        :param frame_size: 시차 맵의 (너비, 높이) 튜플
+        :param chunk_size: 하나의 압축 청크에 담을 프레임 수
+        :param delta: 이전 프레임과의 차분 인코딩 사용 여부
+        :param level: zlib 압축 레벨 (1 ~ 9)
+        :param queue_size: 백그라운드 스레드로 넘길 대기열 크기
+        """
+        self.path = path
+        self.width, self.height = frame_size
+        self.chunk_size = chunk_size
+        self.delta = delta
+        self.level = level
+        self.frame_count = 0
+        self.__file__ = None
+        self.__queue__ = queue.Queue(maxsize=queue_size)
+        self.__thread__ = None
+        self.__error__ = None
+
+    def attach(self):
+        """
+        아카이브 파일을 열고 백그라운드 기록 스레드를 시작합니다.
+        """
+        try:
+            log.alert(f"'{self.path}' 아카이브를 여는 중입니다.")
+            self.__file__ = open(self.path, "wb")
+            self.__file__.write(HEADER.pack(MAGIC, VERSION, FLAG_DELTA if self.delta else 0,
+                                            self.width, self.height, self.chunk_size))
+            self.__thread__ = threading.Thread(target=self.__worker__, daemon=True)
+            self.__thread__.start()
+            log.success(f"'{self.path}' 아카이브를 열었습니다.")
+        except Exception as ex:
+            log.error(f"'{self.path}' 아카이브를 여는 중 문제가 발생하였습니다.", ex)
+
+    def write(self, disparity: np.ndarray):
+        """
+        시차 맵 한 프레임을 기록 대기열에 추가합니다.
+        int16 (SGBM 원본 x16 고정 소수점) 은 그대로, 실수형은 x16 후 반올림하여 저장합니다.
+
+        :param disparity: 시차 맵 (Calculate.depth 의 결과)
+        """
+        if self.__error__ is not None:
+            log.error("아카이브 기록 스레드에서 문제가 발생하였습니다.", self.__error__)
+
+        if disparity.shape != (self.height, self.width):
+            log.warn(f"프레임 크기가 일치하지 않습니다. {disparity.shape[::-1]} != {(self.width, self.height)} 건너뜁니다...")
+            return
+
+        if disparity.dtype != np.int16:
+            disparity = np.clip(np.rint(disparity * 16.0), -32768, 32767).astype(np.int16)
+
+        self.__queue__.put(disparity.copy())
+        self.frame_count += 1
+
+    def detach(self):
+        """
+        남은 프레임을 모두 기록하고 인덱스를 작성한 뒤 아카이브를 닫습니다.
+        """
+        try:
+            log.alert(f"'{self.path}' 아카이브를 닫는 중입니다.")
+            self.__queue__.put(None)
+            self.__thread__.join()
+
+            if self.__error__ is not None:
+                raise self.__error__
+
+            log.success(f"'{self.path}' 아카이브에 {self.frame_count} 프레임을 저장했습니다.")
+        except Exception as ex:
+            log.error(f"'{self.path}' 아카이브를 닫는 중 문제가 발생하였습니다.", ex)
+
+    def __encode__(self, frames: list) -> bytes:
+        """
+        프레임 목록을 하나의 압축 청크로 인코딩합니다.
+        차분은 uint16 으로 계산하여 오버플로가 나더라도 무손실로 복원됩니다.
+        """
+        stack = np.stack(frames).view(np.uint16)
+        if self.delta and len(frames) > 1:
+            stack = np.concatenate((stack[:1], np.diff(stack, axis=0)))
+        return zlib.compress(stack.tobytes(), self.level)
+
+    def __worker__(self):
+        index = []
+        frames = []
+        first_frame = 0
+        finished = False
+
+        def flush():
+            nonlocal first_frame
+            data = self.__encode__(frames)
+            self.__file__.write(CHUNK.pack(CHUNK_MAGIC, first_frame, len(frames), len(data)))
+            offset = self.__file__.tell()
+            self.__file__.write(data)
+            # 프로세스가 종료되더라도 완성된 청크는 디스크에 남도록 합니다.
+            self.__file__.flush()
+            index.append((offset, len(data), first_frame, len(frames)))
+            first_frame += len(frames)
+            frames.clear()
+
+        try:
+            while True:
+                frame = self.__queue__.get()
+                if frame is None:
+                    finished = True
+                    break
+                frames.append(frame)
+                if len(frames) >= self.chunk_size:
+                    flush()
+
+            if frames:
+                flush()
+        except Exception as ex:
+            self.__error__ = ex
+        finally:
+            # 오류가 발생하더라도 이미 기록된 청크는 읽을 수 있도록 인덱스와 푸터를 작성합니다.
+            try:
+                index_offset = self.__file__.tell()
+                for entry in index:
+                    self.__file__.write(INDEX.pack(*entry))
+                self.__file__.write(FOOTER.pack(index_offset, len(index), MAGIC))
+            except Exception as ex:
+                self.__error__ = self.__error__ or ex
+            self.__file__.close()
+
+        # 오류로 중단된 경우에도 write 가 대기열에서 멈추지 않도록 detach 전까지 비워 둡니다.
+        # 종료 신호를 이미 받은 뒤 (detach 중 마지막 청크 기록 실패) 라면 기다릴 필요가 없습니다.
+        if self.__error__ is not None and not finished:
+            while self.__queue__.get() is not None:
+                pass
+
+
+class DepthReader:
+    def __init__(self, path: str):
+        """
+        DepthReader 객체를 초기화합니다.
+        파일은 메모리 맵으로 열리며, 프레임은 접근 시점에 청크 단위로 디코딩됩니다.
+
+        :param path: 아카이브 파일 경로
+        """
+        self.path = path
+        self.__cache__ = (None, None)
+
+        try:
+            self.__data__ = np.memmap(path, dtype=np.uint8, mode="r")
+
+            magic, version, flags, self.width, self.height, self.chunk_size = HEADER.unpack_from(self.__data__, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("StereoX2 뎁스 아카이브 파일이 아닙니다.")
+            self.delta = bool(flags & FLAG_DELTA)
+
+            magic = None
+            if len(self.__data__) >= HEADER.size + FOOTER.size:
+                index_offset, chunk_count, magic = FOOTER.unpack_from(self.__data__, len(self.__data__) - FOOTER.size)
+
+            if magic == MAGIC:
+                self.__index__ = [INDEX.unpack_from(self.__data__, index_offset + i * INDEX.size) for i in range(chunk_count)]
+            else:
+                log.warn(f"'{path}' 아카이브의 인덱스가 없습니다. 기록이 정상적으로 종료되지 않았을 수 있어 청크를 탐색하여 복구합니다.")
+                self.__index__ = self.__scan__()
+
+            self.__first__ = [entry[2] for entry in self.__index__]
+            self.frame_count = sum(entry[3] for entry in self.__index__)
+        except Exception as ex:
+            log.error(f"'{path}' 아카이브를 읽던 중 문제가 발생하였습니다.", ex)
+
+    def __scan__(self) -> list:
+        """
+        청크 헤더를 순서대로 읽어 인덱스를 재구성합니다. 잘린 마지막 청크는 제외됩니다.
+        """
+        index = []
+        offset = HEADER.size
+        while offset + CHUNK.size <= len(self.__data__):
+            magic, first_frame, frame_count, length = CHUNK.unpack_from(self.__data__, offset)
+            if magic != CHUNK_MAGIC or offset + CHUNK.size + length > len(self.__data__):
+                break
+            index.append((offset + CHUNK.size, length, first_frame, frame_count))
+            offset += CHUNK.size + length
+        return index
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.read(index)
+
+    def __decode__(self, chunk: int) -> np.ndarray:
+        if self.__cache__[0] == chunk:
+            return self.__cache__[1]
+
+        offset, length, _, count = self.__index__[chunk]
+        data = zlib.decompress(self.__data__[offset:offset + length])
+        stack = np.frombuffer(data, dtype=np.uint16).reshape(count, self.height, self.width)
+        if self.delta:
+            stack = np.cumsum(stack, axis=0, dtype=np.uint16)
+        stack = stack.view(np.int16)
+        # 반환되는 프레임은 캐시된 청크의 뷰이므로, 수정으로 다른 프레임이 손상되지 않도록 읽기 전용으로 둡니다.
+        stack.setflags(write=False)
+
+        self.__cache__ = (chunk, stack)
+        return stack
+
+    def read(self, index: int, raw: bool = False) -> np.ndarray:
+        """
+        지정한 프레임의 시차 맵을 읽습니다.
+
+        :param index: 프레임 번호
+        :param raw: True 이면 x16 고정 소수점 int16 (읽기 전용) 을, False 이면 float32 시차를 반환
+        :return: 시차 맵
+        """
+        if index < 0:
+            index += self.frame_count
+        if not 0 <= index < self.frame_count:
+            raise IndexError(f"프레임 번호가 범위를 벗어났습니다. ({index} / {self.frame_count})")
+
+        chunk = bisect.bisect_right(self.__first__, index) - 1
+        disparity = self.__decode__(chunk)[index - self.__index__[chunk][2]]
+
+        if raw:
+            return disparity
+        return disparity.astype(np.float32) / 16.0
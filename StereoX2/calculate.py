@@ -62,7 +62,7 @@ class Calculate:
 
             return (left_roi, right_roi)
 
-    def depth(self, left_image, right_image, num_disparities = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1):
+    def depth(self, left_image, right_image, num_disparities = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1, raw: bool = False, mode: int = cv2.STEREO_SGBM_MODE_SGBM_3WAY):
         stereo = cv2.StereoSGBM.create(numDisparities=num_disparities,
                                        blockSize=block_size,
                                        # P1=8*3*block_size**2,
@@ -71,10 +71,15 @@ class Calculate:
                                        speckleWindowSize=speckle_window_size,
                                        speckleRange=speckle_range,
                                        disp12MaxDiff=1,
-                                       mode=cv2.STEREO_SGBM_MODE_SGBM_3WAY)
+                                       mode=mode)
         left_gray = cv2.cvtColor(left_image, cv2.COLOR_BGR2GRAY)
         right_gray = cv2.cvtColor(right_image, cv2.COLOR_BGR2GRAY)
-        disparity = stereo.compute(left_gray, right_gray).astype(np.float32) / 16.0
+        disparity = stereo.compute(left_gray, right_gray)
+
+        if raw:
+            return disparity
+
+        disparity = disparity.astype(np.float32) / 16.0
         
         return disparity
     
@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from .frame import Frame
 from .logger import Logger
 
@@ -20,13 +21,44 @@ class Calibration:
         self.board_size = board_size
         self.square_size = square_size
 
-    def start(self, capture_count: int = 128, trigger: int = 32, exit_trigger: int = 27) -> tuple:
+    def __find__(self, gray, pyramid_level: int):
+        """
+        축소된 피라미드 단계에서 체스보드를 찾고, 코너 좌표를 원본 해상도로 환산합니다.
+
+        :return: 원본 해상도 기준 코너 좌표 (찾지 못하면 None)
+        """
+        small = gray
+        for _ in range(pyramid_level):
+            small = cv2.pyrDown(small)
+
+        ret, corners = cv2.findChessboardCorners(small, self.board_size, None, cv2.CALIB_CB_FAST_CHECK)
+        if not ret:
+            return None
+
+        # pyrDown 은 짝수 위치의 픽셀을 남기므로 dst(x) 는 src(2x) 에 대응합니다.
+        return corners * (2 ** pyramid_level)
+
+    def __detect__(self, left_gray, right_gray, pyramid_level: int) -> tuple:
+        return (self.__find__(left_gray, pyramid_level), self.__find__(right_gray, pyramid_level))
+
+    def __refine__(self, gray, corners):
+        """
+        원본 해상도에서 코너 좌표를 서브픽셀 단위로 보정합니다.
+        """
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 1e-3)
+        return cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+
+    def start(self, capture_count: int = 128, trigger: int = 32, exit_trigger: int = 27, pyramid_level: int = 1) -> tuple:
         """
         캘리브레이션 프로세스를 시작합니다.
+        실시간 화면의 체스보드 인식은 축소된 피라미드 단계에서 별도 스레드로 수행되며,
+        이전 인식이 끝나지 않은 프레임은 인식을 건너뜁니다.
+        캡처 시에만 현재 프레임에서 다시 인식한 뒤 원본 해상도에서 서브픽셀 보정합니다.
 
         :param capture_count: 캡처할 이미지 수
         :param trigger: 캡처를 트리거하는 키 코드
         :param exit_trigger: 캡처 프로세스를 종료하는 키 코드
+        :param pyramid_level: 체스보드 인식에 사용할 피라미드 단계 (0: 원본, 1: 1/2, 2: 1/4)
         :return: 캘리브레이션 데이터 튜플
         """
         try:
@@ -41,6 +73,10 @@ class Calibration:
             left_image_points = []
             right_image_points = []
 
+            detector = ThreadPoolExecutor(max_workers=1, thread_name_prefix="StereoX2-Calibration")
+            detection = None
+            left_corners, right_corners = None, None
+
             count = 0
 
             log.alert("캘리브레이션 캡처 프로세스를 시작합니다.")
@@ -54,13 +90,16 @@ class Calibration:
                 left_gray = cv2.cvtColor(left_frame, cv2.COLOR_BGR2GRAY)
                 right_gray = cv2.cvtColor(right_frame, cv2.COLOR_BGR2GRAY)
 
-                left_ret, left_corners = cv2.findChessboardCorners(left_gray, self.board_size, None, cv2.CALIB_CB_FAST_CHECK)
-                right_ret, right_corners = cv2.findChessboardCorners(right_gray, self.board_size, None, cv2.CALIB_CB_FAST_CHECK)
+                if detection is None or detection.done():
+                    if detection is not None:
+                        left_corners, right_corners = detection.result()
+                    detection = detector.submit(self.__detect__, left_gray, right_gray, pyramid_level)
 
-                for ret, frame, corners, label in [
-                    (left_ret, left_frame, left_corners, "LEFT"),
-                    (right_ret, right_frame, right_corners, "RIGHT")
+                for corners, frame, label in [
+                    (left_corners, left_frame, "LEFT"),
+                    (right_corners, right_frame, "RIGHT")
                 ]:
+                    ret = corners is not None
                     status = "RECOGNIZED" if ret else "NOT RECOGNIZED"
                     color = (0, 255, 0) if ret else (0, 0, 255)
                     if ret:
@@ -71,10 +110,11 @@ class Calibration:
 
                 keycode = cv2.waitKey(1) & 0xFF
                 if keycode == trigger:
-                    if left_ret and right_ret:
+                    left_capture, right_capture = self.__detect__(left_gray, right_gray, pyramid_level)
+                    if left_capture is not None and right_capture is not None:
                         obj_points.append(objp)
-                        left_image_points.append(left_corners)
-                        right_image_points.append(right_corners)
+                        left_image_points.append(self.__refine__(left_gray, left_capture))
+                        right_image_points.append(self.__refine__(right_gray, right_capture))
                         count += 1
                         log.alert(f"프레임 {count}/{capture_count} 캡처됨")
                     else:
@@ -83,6 +123,7 @@ class Calibration:
                     log.alert("사용자에 의해 캡처 프로세스가 종료되었습니다.")
                     break
 
+            detector.shutdown(wait=True)
             frm.detach()
 
             if count < capture_count:
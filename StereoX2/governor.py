@@ -0,0 +1,171 @@
+import cv2
+import time
+import numpy as np
+from collections import deque
+from .calculate import Calculate
+from .logger import Logger
+
+calc = Calculate()
+log = Logger("Governor", "log/Governor")
+
+# 느린 (고품질) 모드부터 빠른 모드 순서
+MODE_ORDER = (cv2.STEREO_SGBM_MODE_HH, cv2.STEREO_SGBM_MODE_SGBM, cv2.STEREO_SGBM_MODE_HH4, cv2.STEREO_SGBM_MODE_SGBM_3WAY)
+
+
+class Governor:
+    def __init__(self, target_fps: float = 30.0, num_disparities: int = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1,
+                 mode: int = cv2.STEREO_SGBM_MODE_SGBM_3WAY, levels: list = None, smoothing: float = 0.2, degrade_ratio: float = 1.0, upgrade_ratio: float = 0.6, patience: int = 5, history_size: int = 1024):
+        """
+        Governor 객체를 초기화합니다.
+        프레임당 처리 시간을 목표 FPS 예산과 비교하여 뎁스 계산 품질 단계를 자동으로 조절합니다.
+        처리 시간은 캡처부터 표시까지 루프 전체를 기준으로 하며, 매 프레임 끝에 tick() (또는 update()) 을 호출해야 합니다.
+
+        :param target_fps: 목표 FPS (프레임당 예산 = 1 / target_fps)
+        :param mode: 최고 품질 단계의 SGBM 모드 (HH / SGBM 으로 시작하면 HH4, 3WAY 순으로 낮아지며,
+                     기본값인 3WAY 는 가장 빠른 모드이므로 모드 단계 없이 다른 항목만 조절)
+        :param levels: 품질 단계 목록 (scale, block_size, mode, num_disparities, skip 키를 가진 딕셔너리, 기본값: 입력 파라미터로부터 자동 생성)
+        :param smoothing: 처리 시간 지수 이동 평균 계수
+        :param degrade_ratio: 평균 처리 시간이 예산의 이 비율을 넘으면 품질을 낮춤
+        :param upgrade_ratio: 평균 처리 시간이 예산의 이 비율보다 작으면 품질을 높임
+        :param patience: 품질을 낮추기 전 연속으로 초과해야 하는 프레임 수 (높일 때는 3배)
+        :param history_size: 보관할 프레임별 기록 수
+        """
+        self.budget = 1.0 / target_fps
+        self.params = (uniqueness_ratio, speckle_window_size, speckle_range)
+        self.levels = levels or self.__ladder__(num_disparities, block_size, mode)
+        self.smoothing = smoothing
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.patience = patience
+
+        self.level = 0
+        self.average = None
+        self.frame = 0
+        self.history = deque(maxlen=history_size)
+
+        self.__over__ = 0
+        self.__under__ = 0
+        self.__last__ = None
+        self.__tick__ = None
+
+    def __ladder__(self, num_disparities: int, block_size: int, mode: int) -> list:
+        """
+        기본 품질 단계 목록을 생성합니다. 뒤로 갈수록 빠르고 품질이 낮습니다.
+        """
+        def disparities(scale: float) -> int:
+            return max(16, int(num_disparities * scale) // 16 * 16)
+
+        small_block = max(3, block_size - 2)
+        fast = cv2.STEREO_SGBM_MODE_SGBM_3WAY
+        modes = MODE_ORDER[MODE_ORDER.index(mode):] if mode in MODE_ORDER else (mode, fast)
+        ladder = [
+            {"scale": 1.0, "block_size": block_size, "mode": step, "num_disparities": num_disparities, "skip": 0} for step in modes
+        ] + [
+            {"scale": 1.0,  "block_size": small_block, "mode": fast, "num_disparities": num_disparities,   "skip": 0},
+            {"scale": 0.75, "block_size": small_block, "mode": fast, "num_disparities": disparities(0.75), "skip": 0},
+            {"scale": 0.5,  "block_size": 3,           "mode": fast, "num_disparities": disparities(0.5),  "skip": 0},
+            {"scale": 0.5,  "block_size": 3,           "mode": fast, "num_disparities": disparities(0.5),  "skip": 1},
+            {"scale": 0.5,  "block_size": 3,           "mode": fast, "num_disparities": disparities(0.5),  "skip": 2},
+        ]
+
+        levels = []
+        for level in ladder:
+            if not levels or levels[-1] != level:
+                levels.append(level)
+        return levels
+
+    def settings(self) -> dict:
+        """
+        현재 품질 단계의 설정을 반환합니다.
+        """
+        return self.levels[self.level]
+
+    def tick(self):
+        """
+        직전 tick() 이후 경과한 시간을 프레임 처리 시간으로 update() 에 반영합니다.
+        루프의 매 프레임 끝에서 한 번 호출합니다.
+        """
+        now = time.perf_counter()
+        if self.__tick__ is not None:
+            self.update(now - self.__tick__)
+        self.__tick__ = now
+
+    def update(self, elapsed: float):
+        """
+        처리 시간을 반영하고, 필요하면 품질 단계를 변경합니다.
+        건너뛴 프레임도 포함하여 매 프레임 호출하면 건너뛰기 단계의 비용이 자연스럽게 평균됩니다.
+
+        :param elapsed: 캡처, 렉티피케이션, 뎁스 계산, 표시를 포함한 프레임당 처리 시간 (초)
+        """
+        if self.history and self.history[-1]["frame"] == self.frame:
+            self.history[-1]["frame_elapsed"] = elapsed
+
+        if self.average is None:
+            self.average = elapsed
+        else:
+            self.average += self.smoothing * (elapsed - self.average)
+
+        # 한 단계 위로 올라갔을 때의 예상 비용으로 판단합니다.
+        # 프레임 건너뛰기 단계에서 벗어나면 계산하는 프레임 비율만큼 비용이 늘어납니다.
+        upgrade_cost = self.average
+        if self.level > 0:
+            upgrade_cost *= (self.levels[self.level].get("skip", 0) + 1) / (self.levels[self.level - 1].get("skip", 0) + 1)
+
+        if self.average > self.budget * self.degrade_ratio:
+            self.__over__ += 1
+            self.__under__ = 0
+        elif upgrade_cost < self.budget * self.upgrade_ratio:
+            self.__under__ += 1
+            self.__over__ = 0
+        else:
+            self.__over__ = self.__under__ = 0
+
+        if self.__over__ >= self.patience and self.level < len(self.levels) - 1:
+            self.__change__(self.level + 1)
+        elif self.__under__ >= self.patience * 3 and self.level > 0:
+            self.__change__(self.level - 1)
+
+    def __change__(self, level: int):
+        log.alert(f"품질 단계를 변경합니다. {self.level} -> {level} (평균 {self.average * 1000:.1f}ms / 예산 {self.budget * 1000:.1f}ms)")
+        self.level = level
+        self.average = None
+        self.__over__ = self.__under__ = 0
+
+    def depth(self, left_image, right_image):
+        """
+        현재 품질 단계로 시차 맵을 계산하고, 선택한 설정과 계산 시간을 history 에 기록합니다.
+        품질 단계 조절은 tick() / update() 로 전달되는 프레임 전체 시간을 기준으로 합니다.
+        축소된 해상도로 계산한 시차 맵은 입력 크기와 원본 시차 단위로 복원되며,
+        건너뛴 프레임에는 직전 시차 맵을 그대로 반환합니다.
+
+        :return: 시차 맵
+        """
+        setting = self.settings()
+        level = self.level
+        height, width = left_image.shape[:2]
+        self.frame += 1
+
+        last = self.__last__
+        if setting["skip"] and last is not None and last.shape == (height, width) and self.frame % (setting["skip"] + 1):
+            self.history.append({"frame": self.frame, "level": level, **setting, "elapsed": 0.0, "skipped": True})
+            return last
+
+        start = time.perf_counter()
+
+        scale = setting["scale"]
+        if scale != 1.0:
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            left_image = cv2.resize(left_image, size, interpolation=cv2.INTER_AREA)
+            right_image = cv2.resize(right_image, size, interpolation=cv2.INTER_AREA)
+
+        disparity = calc.depth(left_image, right_image, setting["num_disparities"], setting["block_size"], *self.params, mode=setting["mode"])
+
+        if scale != 1.0:
+            disparity = cv2.resize(disparity, (width, height), interpolation=cv2.INTER_NEAREST)
+            # 유효하지 않은 픽셀 (음수) 은 단계와 관계없이 같은 값을 유지합니다.
+            disparity = np.where(disparity < 0, disparity, disparity / scale).astype(np.float32)
+
+        elapsed = time.perf_counter() - start
+        self.__last__ = disparity
+        self.history.append({"frame": self.frame, "level": level, **setting, "elapsed": elapsed, "skipped": False})
+        return disparity
@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 from .frame import Frame
 from .calculate import Calculate
+from .governor import Governor
 from .logger import Logger
 
 calc = Calculate()
@@ -198,13 +199,18 @@ class Preview:
         frm.detach()
         log.alert("오버랩 프리뷰가 중단되었습니다.")
 
-    def depth_preview(self, file: str = "calibration.npz", num_disparities: int = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1, exit_trigger: int = 27):
+    def depth_preview(self, file: str = "calibration.npz", num_disparities: int = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1, exit_trigger: int = 27, target_fps: float = None):
         """
         스테레오 카메라로부터 뎁스 맵을 실시간으로 프리뷰합니다.
 
         :param file: 캘리브레이션 데이터 파일 경로
         :param exit_trigger: 프리뷰를 종료할 키 코드 (기본값: ESC)
+        :param target_fps: 지정하면 이 FPS 를 유지하도록 뎁스 계산 품질을 자동으로 조절
         """
+        governor = None
+        if target_fps:
+            governor = Governor(target_fps, num_disparities, block_size, uniqueness_ratio, speckle_window_size, speckle_range)
+
         data = calc.read_calibration(file)
         map1x, map1y, map2x, map2y, roi1, roi2 = calc.rectification(data, (self.width, self.height))
 
@@ -222,7 +228,10 @@ class Preview:
 
             if ret:
                 try:
-                    depth = calc.depth(left_roi, right_roi, num_disparities, block_size, uniqueness_ratio, speckle_window_size, speckle_range)
+                    if governor is not None:
+                        depth = governor.depth(left_roi, right_roi)
+                    else:
+                        depth = calc.depth(left_roi, right_roi, num_disparities, block_size, uniqueness_ratio, speckle_window_size, speckle_range)
                     depth_min, depth_max = calc.depth_distance(depth)
 
                     depth_map_normalized = cv2.normalize(depth, None, 0, 255, cv2.NORM_MINMAX)
@@ -231,6 +240,8 @@ class Preview:
                     overlap_frame = cv2.addWeighted(left_roi, 0.25, depth_map_colored, 1.0, 0)
 
                     cv2.putText(overlap_frame, f'{depth_max:.2f}', (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.75, (255, 255, 255), 1)
+                    if governor is not None:
+                        cv2.putText(overlap_frame, f'LEVEL {governor.level}', (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.75, (255, 255, 255), 1)
 
                     cv2.namedWindow("StereoX2 - DEPTH MAP PREVIEW", flags=cv2.WINDOW_NORMAL)
                     cv2.imshow("StereoX2 - DEPTH MAP PREVIEW", overlap_frame)
@@ -240,5 +251,8 @@ class Preview:
             if cv2.waitKey(1) & 0xFF == exit_trigger:
                 break
 
+            if governor is not None:
+                governor.tick()
+
         frm.detach()
         log.alert("뎁스 프리뷰가 중단되었습니다.")
\ No newline at end of file
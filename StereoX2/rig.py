@@ -0,0 +1,290 @@
+import os
+import cv2
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .frame import Frame
+from .calculate import Calculate
+from .logger import Logger
+
+calc = Calculate()
+log = Logger("Rig", "log/Rig")
+
+
+class Rig:
+    def __init__(self, name: str, source: int | str, source_size: tuple, file: str = "calibration.npz", fps: float = 30.0, priority: int = 0, max_failures: int = 30,
+                 num_disparities: int = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1):
+        """
+        Rig 객체를 초기화합니다.
+
+        :param name: 리그 이름
+        :param source: 카메라 소스 (장치 인덱스 또는 비디오 파일 경로)
+        :param source_size: 소스의 (너비, 높이) 튜플
+        :param file: 캘리브레이션 데이터 파일 경로
+        :param fps: 목표 처리 FPS
+        :param priority: 우선순위 (높을수록 먼저 처리, priority 스케줄링에서만 사용)
+        :param max_failures: 연속으로 읽기에 실패하면 리그를 중단할 횟수
+        """
+        self.name = name
+        self.source = source
+        self.width, self.height = source_size
+        self.file = file
+        self.fps = fps
+        self.priority = priority
+        self.max_failures = max_failures
+        self.params = (num_disparities, block_size, uniqueness_ratio, speckle_window_size, speckle_range)
+
+        self.frm = Frame(source=source, source_size=source_size)
+        self.maps = None
+
+        self.running = False
+        self.busy = False
+        self.pending = None
+        self.next_due = 0.0
+        self.last_served = 0.0
+
+        self.captured = 0
+        self.processed = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.started = 0.0
+
+    def attach(self):
+        """
+        캘리브레이션 데이터를 읽어 렉티피케이션 맵을 캐시하고 소스를 연결합니다.
+        """
+        data = calc.read_calibration(self.file)
+        self.maps = calc.rectification(data, (self.width, self.height))
+        self.frm.attach()
+        self.running = True
+        self.started = time.monotonic()
+        self.next_due = self.started
+
+    def detach(self):
+        """
+        소스 연결을 해제합니다.
+        """
+        self.running = False
+        self.frm.detach()
+
+    def exhausted(self) -> bool:
+        """
+        소스가 닫혔거나 비디오 파일의 끝에 도달했는지 확인합니다.
+        """
+        source = self.frm.__source__
+        if source is None or not source.isOpened():
+            return True
+
+        count = source.get(cv2.CAP_PROP_FRAME_COUNT)
+        return isinstance(self.source, str) and count > 0 and source.get(cv2.CAP_PROP_POS_FRAMES) >= count
+
+    def process(self, left_frame, right_frame) -> tuple:
+        """
+        렉티피케이션, ROI 추출, 뎁스 계산을 수행합니다.
+
+        :return: (왼쪽 ROI, 시차 맵) 튜플
+        """
+        map1x, map1y, map2x, map2y, roi1, roi2 = self.maps
+        left_rectified, right_rectified = calc.mapping((left_frame, map1x, map1y), (right_frame, map2x, map2y))
+        left_roi, right_roi = calc.get_roi(left_rectified, right_rectified, roi1, roi2)
+        return (left_roi, calc.depth(left_roi, right_roi, *self.params))
+
+    def stats(self) -> dict:
+        """
+        리그의 처리량 통계를 반환합니다.
+
+        :return: 동작 여부, 캡처 / 처리 수, FPS 제한으로 건너뛴 수, 과부하 / 처리 오류로 드롭된 수와 실제 처리 FPS
+        """
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return {
+            "running": self.running,
+            "captured": self.captured,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "fps": self.processed / elapsed if self.started else 0.0,
+        }
+
+
+class RigManager:
+    def __init__(self, workers: int = None, policy: str = "fair", callback=None):
+        """
+        RigManager 객체를 초기화합니다.
+        여러 리그의 렉티피케이션 / SGBM 작업을 하나의 제한된 워커 풀에서 스케줄링합니다.
+
+        :param workers: 워커 스레드 수 (기본값: CPU 코어 수)
+        :param policy: 스케줄링 방식 ("fair" 또는 "priority")
+        :param callback: 처리 결과를 받을 함수 callback(name, left_roi, disparity)
+        """
+        if policy not in ("fair", "priority"):
+            log.error(f"지원하지 않는 스케줄링 방식입니다. ({policy})")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.policy = policy
+        self.callback = callback
+        self.rigs = {}
+
+        self.running = False
+        self.__condition__ = threading.Condition()
+        self.__in_flight__ = 0
+        self.__pool__ = None
+        self.__threads__ = []
+        self.__num_threads__ = None
+
+    def add(self, rig: Rig):
+        """
+        리그를 등록합니다.
+
+        :param rig: 등록할 Rig 객체
+        """
+        if rig.name in self.rigs:
+            log.error(f"이미 등록된 리그 이름입니다. ({rig.name})")
+        self.rigs[rig.name] = rig
+
+    def start(self):
+        """
+        모든 리그를 연결하고 캡처 / 스케줄러 스레드를 시작합니다.
+        """
+        log.alert(f"{len(self.rigs)}개의 리그를 {self.workers}개의 워커로 시작합니다.")
+
+        # 워커 풀과 OpenCV 내부 스레드 풀이 코어를 중복 점유하지 않도록 제한합니다.
+        # 프로세스 전역 설정이므로 stop() 에서 원래 값으로 되돌립니다.
+        self.__num_threads__ = cv2.getNumThreads()
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) // self.workers))
+
+        for rig in self.rigs.values():
+            rig.attach()
+
+        self.running = True
+        self.__pool__ = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="StereoX2-Rig")
+        self.__threads__ = [threading.Thread(target=self.__capture__, args=(rig,), daemon=True) for rig in self.rigs.values()]
+        self.__threads__.append(threading.Thread(target=self.__schedule__, daemon=True))
+        for thread in self.__threads__:
+            thread.start()
+
+        log.success("리그 매니저가 시작되었습니다.")
+
+    def stop(self):
+        """
+        스케줄링을 중단하고 진행 중인 작업을 마친 뒤 모든 리그를 해제합니다.
+        """
+        if self.__pool__ is None:
+            log.warn("리그 매니저가 시작되지 않았습니다.")
+            return
+
+        log.alert("리그 매니저를 중단하는 중입니다.")
+
+        with self.__condition__:
+            self.running = False
+            self.__condition__.notify_all()
+
+        for thread in self.__threads__:
+            thread.join()
+        self.__pool__.shutdown(wait=True)
+        self.__pool__ = None
+
+        for rig in self.rigs.values():
+            rig.detach()
+
+        cv2.setNumThreads(self.__num_threads__)
+        self.__num_threads__ = None
+
+        log.success("리그 매니저가 중단되었습니다.")
+
+    def stats(self) -> dict:
+        """
+        리그별 처리량 통계를 반환합니다.
+
+        :return: {리그 이름: 통계} 딕셔너리
+        """
+        with self.__condition__:
+            return {name: rig.stats() for name, rig in self.rigs.items()}
+
+    def __capture__(self, rig: Rig):
+        """
+        리그의 소스를 계속 읽어 최신 프레임만 보관합니다.
+        처리되기 전에 새 프레임으로 덮어써진 프레임은 처리할 차례인데도 이전 작업이 끝나지 않았거나
+        워커가 모두 사용 중이었던 경우에만 dropped 로, 그 외 (FPS 제한 등) 에는 skipped 로 집계됩니다.
+        소스가 끝났거나 연속으로 max_failures 회 읽기에 실패하면 리그를 중단합니다.
+        """
+        failures = 0
+        while self.running and rig.running:
+            ret, left_frame, right_frame = rig.frm.read()
+            if not ret:
+                failures += 1
+                if failures >= rig.max_failures or rig.exhausted():
+                    log.warn(f"'{rig.name}' 리그의 소스를 더 이상 읽을 수 없어 중단합니다. (연속 실패 {failures}회)")
+                    with self.__condition__:
+                        rig.running = False
+                        self.__condition__.notify_all()
+                    break
+                # 실패가 이어질수록 재시도 간격을 늘립니다.
+                time.sleep(min(0.01 * 2 ** failures, 1.0))
+                continue
+
+            failures = 0
+
+            with self.__condition__:
+                rig.captured += 1
+                if rig.pending is not None:
+                    overloaded = rig.busy or self.__in_flight__ >= self.workers
+                    if time.monotonic() >= rig.next_due and overloaded:
+                        rig.dropped += 1
+                    else:
+                        rig.skipped += 1
+                rig.pending = (left_frame, right_frame)
+                self.__condition__.notify_all()
+
+    def __select__(self, now: float) -> Rig:
+        """
+        지금 처리할 수 있는 리그 중 스케줄링 방식에 따라 하나를 고릅니다.
+        """
+        ready = [rig for rig in self.rigs.values() if rig.pending is not None and not rig.busy and rig.next_due <= now]
+        if not ready:
+            return None
+
+        if self.policy == "priority":
+            return min(ready, key=lambda rig: (-rig.priority, rig.next_due))
+        return min(ready, key=lambda rig: rig.last_served)
+
+    def __schedule__(self):
+        with self.__condition__:
+            while self.running:
+                now = time.monotonic()
+                rig = self.__select__(now) if self.__in_flight__ < self.workers else None
+
+                if rig is None:
+                    # 다음 마감 시각까지만 대기하여 FPS 제한을 지킵니다.
+                    waiting = [r.next_due - now for r in self.rigs.values() if r.pending is not None and not r.busy and r.next_due > now]
+                    self.__condition__.wait(timeout=min(waiting) if waiting else None)
+                    continue
+
+                frames, rig.pending = rig.pending, None
+                rig.busy = True
+                rig.last_served = now
+                if rig.fps > 0:
+                    # 늦어졌더라도 다음 슬롯은 최소 한 주기 뒤로 잡아, 처리 중에 바로 다시 차례가 되지 않도록 합니다.
+                    rig.next_due += 1.0 / rig.fps
+                    if rig.next_due <= now:
+                        rig.next_due = now + 1.0 / rig.fps
+                else:
+                    rig.next_due = now
+                self.__in_flight__ += 1
+                self.__pool__.submit(self.__work__, rig, *frames)
+
+    def __work__(self, rig: Rig, left_frame, right_frame):
+        try:
+            left_roi, disparity = rig.process(left_frame, right_frame)
+            if self.callback is not None:
+                self.callback(rig.name, left_roi, disparity)
+            with self.__condition__:
+                rig.processed += 1
+        except Exception as ex:
+            log.warn(f"'{rig.name}' 리그를 처리하던 중 문제가 발생하였습니다. {ex}")
+            with self.__condition__:
+                rig.dropped += 1
+        finally:
+            with self.__condition__:
+                rig.busy = False
+                self.__in_flight__ -= 1
+                self.__condition__.notify_all()
@@ -0,0 +1,179 @@
+import cv2
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from .frame import Frame
+from .calculate import Calculate
+from .logger import Logger
+
+calc = Calculate()
+log = Logger("Stream", "log/Stream")
+
+MODES = ("frame", "roi", "depth")
+
+
+class Stream:
+    def __init__(self, source: int | str, source_size: tuple, mode: str = "frame", file: str = "calibration.npz", buffer_size: int = 1, latest_only: bool = True, max_failures: int = 30,
+                 num_disparities: int = 16, block_size: int = 5, uniqueness_ratio: int = 15, speckle_window_size: int = 150, speckle_range: int = 1):
+        """
+        Stream 객체를 초기화합니다.
+        블로킹 OpenCV 작업은 전용 스레드에서 실행되며, 결과는 `async for` 로 받을 수 있습니다.
+
+        :param source: 카메라 소스 (장치 인덱스 또는 비디오 파일 경로)
+        :param source_size: 소스의 (너비, 높이) 튜플
+        :param mode: 스트림 종류 ("frame": 원본 프레임 쌍, "roi": 렉티피케이션된 ROI 쌍, "depth": (왼쪽 ROI, 시차 맵))
+        :param file: 캘리브레이션 데이터 파일 경로 ("roi", "depth" 모드에서 사용)
+        :param buffer_size: 소비자를 기다리는 결과의 최대 개수
+        :param latest_only: 버퍼가 가득 찼을 때 가장 오래된 결과를 버릴지 여부 (False 이면 생산자가 대기)
+        :param max_failures: 연속으로 읽기 / 처리에 실패하면 스트림을 종료할 횟수
+        """
+        if mode not in MODES:
+            log.error(f"지원하지 않는 스트림 모드입니다. ({mode})")
+
+        self.source = source
+        self.width, self.height = source_size
+        self.mode = mode
+        self.file = file
+        self.buffer_size = buffer_size
+        self.latest_only = latest_only
+        self.max_failures = max_failures
+        self.params = (num_disparities, block_size, uniqueness_ratio, speckle_window_size, speckle_range)
+
+        self.frm = Frame(source=source, source_size=source_size)
+        self.maps = None
+        self.dropped = 0
+        self.running = False
+
+        self.__executor__ = None
+        self.__queue__ = None
+        self.__task__ = None
+
+    async def attach(self):
+        """
+        소스를 연결하고 백그라운드 스트리밍을 시작합니다.
+        """
+        loop = asyncio.get_running_loop()
+        self.__executor__ = ThreadPoolExecutor(max_workers=1, thread_name_prefix="StereoX2-Stream")
+        self.__queue__ = asyncio.Queue(maxsize=self.buffer_size)
+
+        if self.mode != "frame":
+            data = await loop.run_in_executor(self.__executor__, calc.read_calibration, self.file)
+            self.maps = await loop.run_in_executor(self.__executor__, calc.rectification, data, (self.width, self.height))
+
+        await loop.run_in_executor(self.__executor__, self.frm.attach)
+
+        self.running = True
+        self.__task__ = asyncio.create_task(self.__produce__())
+        log.alert("스트림이 시작되었습니다.")
+
+    async def detach(self):
+        """
+        스트리밍을 중단하고 소스 연결을 해제합니다.
+        """
+        if self.__task__ is None:
+            return
+
+        self.running = False
+        ended = self.__task__.done()
+        self.__task__.cancel()
+        try:
+            await self.__task__
+        except asyncio.CancelledError:
+            pass
+        self.__task__ = None
+
+        # 진행 중이던 읽기가 끝난 뒤 같은 스레드에서 해제됩니다.
+        await asyncio.get_running_loop().run_in_executor(self.__executor__, self.frm.detach)
+        self.__executor__.shutdown(wait=True)
+        if not ended:
+            self.__put__(None)
+        log.alert("스트림이 중단되었습니다.")
+
+    async def __aenter__(self):
+        await self.attach()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.detach()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> tuple:
+        if self.__queue__ is None:
+            raise StopAsyncIteration
+
+        item = await self.__queue__.get()
+        if item is None:
+            # 다른 소비자도 종료를 알 수 있도록 다시 넣어 둡니다.
+            self.__put__(None)
+            raise StopAsyncIteration
+        return item
+
+    def __put__(self, item):
+        """
+        결과를 버퍼에 넣고, 가득 찼다면 가장 오래된 결과를 버립니다.
+        """
+        while self.__queue__.full():
+            self.__queue__.get_nowait()
+            self.dropped += 1
+        self.__queue__.put_nowait(item)
+
+    def __exhausted__(self) -> bool:
+        """
+        소스가 닫혔거나 비디오 파일의 끝에 도달했는지 확인합니다.
+        """
+        source = self.frm.__source__
+        if source is None or not source.isOpened():
+            return True
+
+        count = source.get(cv2.CAP_PROP_FRAME_COUNT)
+        return isinstance(self.source, str) and count > 0 and source.get(cv2.CAP_PROP_POS_FRAMES) >= count
+
+    def __process__(self) -> tuple:
+        """
+        전용 스레드에서 한 프레임을 읽고 모드에 맞게 처리합니다.
+        """
+        ret, left_frame, right_frame = self.frm.read()
+        if not ret:
+            return None
+        if self.mode == "frame":
+            return (left_frame, right_frame)
+
+        map1x, map1y, map2x, map2y, roi1, roi2 = self.maps
+        left_rectified, right_rectified = calc.mapping((left_frame, map1x, map1y), (right_frame, map2x, map2y))
+        left_roi, right_roi = calc.get_roi(left_rectified, right_rectified, roi1, roi2)
+        if self.mode == "roi":
+            return (left_roi, right_roi)
+
+        return (left_roi, calc.depth(left_roi, right_roi, *self.params))
+
+    async def __produce__(self):
+        loop = asyncio.get_running_loop()
+        failures = 0
+        while self.running:
+            try:
+                item = await loop.run_in_executor(self.__executor__, self.__process__)
+            except Exception as ex:
+                log.warn(f"스트림 프레임을 처리하던 중 문제가 발생하였습니다. {ex}")
+                item = None
+
+            if item is None:
+                failures += 1
+                if failures >= self.max_failures or await loop.run_in_executor(self.__executor__, self.__exhausted__):
+                    log.alert(f"소스를 더 이상 읽을 수 없어 스트림을 종료합니다. (연속 실패 {failures}회)")
+                    break
+                # 실패가 이어질수록 재시도 간격을 늘립니다.
+                await asyncio.sleep(min(0.01 * 2 ** failures, 1.0))
+                continue
+
+            failures = 0
+            if self.latest_only:
+                self.__put__(item)
+            else:
+                await self.__queue__.put(item)
+
+        self.running = False
+        if self.latest_only:
+            self.__put__(None)
+        else:
+            await self.__queue__.put(None)